@@ -1,20 +1,40 @@
+import re
+
+_FILENAME_UNSAFE = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+_CR_LINE_BREAK = re.compile(r"\r\n?")
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"})
+_LINE_BREAK_TABLE = str.maketrans({"\n": None})
+
+
+def _escape_text(value: str):
+    if "\r" in value:
+        value = _CR_LINE_BREAK.sub("\n", value)
+    return value.translate(_ESCAPE_TABLE)
+
+
+def _strip_line_breaks(value: str):
+    if "\r" in value:
+        value = _CR_LINE_BREAK.sub("\n", value)
+    return value.translate(_LINE_BREAK_TABLE)
+
+
 def create_vcard(contact: dict):
     """
     The mappings used below are from https://www.w3.org/TR/vcard-rdf/#Mapping
+    Text values are escaped per RFC 2426 section 4, TEL and URL only lose line breaks
     """
-    vc_begin = "BEGIN:VCARD\n"
-    vc_version = "VERSION:3.0\n"
-    vc_name = f"N;CHARSET=UTF-8:{contact['last_name']};{contact['first_name']};;;\n"
-    vc_title = f"TITLE;CHARSET=UTF-8:{contact['title']}\n"
-    vc_org = f"ORG;CHARSET=UTF-8:{contact['org']}\n"
-    vc_phone = f"TEL;TYPE=WORK,VOICE:{contact['phone']}\n"
-    vc_email = f"EMAIL;TYPE=WORK:{contact['email']}\n"
-    vc_website = f"URL;TYPE=WORK:{contact['website']}\n"
-    vc_address = f"ADR;TYPE=WORK;CHARSET=UTF-8:{contact['street']};{contact['city']};{contact['p_code']};{contact['country']}\n"
-    vc_end = "END:VCARD\n"
-
-    vc_filename = f"{contact['last_name'].lower()}_{contact['first_name'].lower()}.vcf"
-    vc_output = vc_begin + vc_version + vc_name + vc_title + vc_org + vc_phone + vc_email + vc_website + vc_address + vc_end
+    vc_output = "".join((
+        "BEGIN:VCARD\r\nVERSION:3.0\r\nN;CHARSET=UTF-8:", _escape_text(contact['last_name']), ";", _escape_text(contact['first_name']), ";;;\r\n",
+        "TITLE;CHARSET=UTF-8:", _escape_text(contact['title']), "\r\n",
+        "ORG;CHARSET=UTF-8:", _escape_text(contact['org']), "\r\n",
+        "TEL;TYPE=WORK,VOICE:", _strip_line_breaks(contact['phone']), "\r\n",
+        "EMAIL;TYPE=WORK:", _escape_text(contact['email']), "\r\n",
+        "URL;TYPE=WORK:", _strip_line_breaks(contact['website']), "\r\n",
+        "ADR;TYPE=WORK;CHARSET=UTF-8:", _escape_text(contact['street']), ";", _escape_text(contact['city']), ";",
+        _escape_text(contact['p_code']), ";", _escape_text(contact['country']), "\r\n",
+        "END:VCARD\r\n",
+    ))
+    vc_filename = _FILENAME_UNSAFE.sub("_", f"{contact['last_name']}_{contact['first_name']}".lower()) + ".vcf"
 
     vc_final = {
         "filename" : vc_filename,
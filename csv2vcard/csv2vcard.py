@@ -1,6 +1,6 @@
 from csv2vcard.export_vcard import check_export, export_vcard
 from csv2vcard.create_vcard import create_vcard
-from csv2vcard.parse_csv import parse_csv
+from csv2vcard.parse_csv import iter_contacts
 
 
 def csv2vcard(csv_filename: str, csv_delimeter: str):
@@ -9,7 +9,7 @@ def csv2vcard(csv_filename: str, csv_delimeter: str):
     """
     check_export()
 
-    for c in parse_csv(csv_filename, csv_delimeter):
+    for c in iter_contacts(csv_filename, csv_delimeter):
         vcard = create_vcard(c)
         export_vcard(vcard)
 
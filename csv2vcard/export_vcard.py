@@ -5,14 +5,29 @@ def export_vcard(vc_final):
     Exporting a vCard to /export/
     """
     try:
-        with open(f"export/{vc_final['filename']}", "w") as f:
-            f.write(vc_final['output'])
-            f.close()
-            print(f"Created vCard 3.0 for {vc_final['name']}.")
+        with open(f"export/{vc_final['filename']}", "wb") as f:
+            f.write(vc_final['output'].encode("utf-8"))
+        print(f"Created vCard 3.0 for {vc_final['name']}.")
     except IOError:
         print(f"I/O error for {vc_final['filename']}")
 
 
+def export_vcards_concat(vc_finals, filename: str):
+    """
+    Exporting many vCards into a single /export/ file, flushed once at the end
+    """
+    check_export()
+    try:
+        with open(f"export/{filename}", "wb", buffering=1 << 20) as f:
+            count = 0
+            for vc_final in vc_finals:
+                f.write(vc_final['output'].encode("utf-8"))
+                count += 1
+        print(f"Created {count} vCard 3.0 entries in {filename}.")
+    except IOError:
+        print(f"I/O error for {filename}")
+
+
 def check_export():
     """
     Checks if export folder exists in directory
@@ -1,17 +1,47 @@
 import csv
-import codecs
+import io
+import itertools
 
 def parse_csv(csv_filename: str, csv_delimeter: str):
     """
     Simple csv parser with a ; delimiter
     """
+    return list(iter_contacts(csv_filename, csv_delimeter))
+
+
+def iter_contacts(csv_filename: str, csv_delimeter: str):
+    """
+    Streams contacts from the csv one row at a time
+    """
     print("Parsing csv..")
     try:
-        with codecs.open(f"{csv_filename}", "r", "utf-8-sig") as f:
-            contacts = csv.reader(f, delimiter=csv_delimeter)
-            header = next(contacts)  # saves header
-            parsed_contacts = [dict(zip(header, row)) for row in contacts]
-            return parsed_contacts
+        with open(csv_filename, "r", encoding="utf-8-sig", newline="", buffering=1 << 20) as f:
+            yield from _iter_contacts(f, csv_delimeter)
     except IOError:
         print(f"I/O error for {csv_filename}")
-        return []
+
+
+def parse_csv_from_stream(csv_file, csv_delimeter: str):
+    """
+    Same as parse_csv but for an open text stream, e.g. opened with newline=""
+    """
+    return list(_iter_contacts(csv_file, csv_delimeter))
+
+
+def parse_csv_from_text(csv_text: str, csv_delimeter: str):
+    """
+    Same as parse_csv but for csv content that is already in memory
+    """
+    return parse_csv_from_stream(io.StringIO(csv_text.lstrip("\ufeff"), newline=""), csv_delimeter)
+
+
+def _iter_contacts(csv_file, csv_delimeter: str):
+    lines = iter(csv_file)
+    first = next(lines, "").lstrip("\ufeff")  # BOM left by a plain utf-8 decode
+    contacts = csv.reader(itertools.chain([first], lines), delimiter=csv_delimeter)
+    header = next(contacts, None)
+    if header is None:
+        return
+    header = [h.strip() for h in header]  # saves header once
+    for row in contacts:
+        yield dict(zip(header, row))